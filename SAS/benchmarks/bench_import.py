@@ -0,0 +1,71 @@
+"""Benchmark of the bulk CSV import against per-row ORM inserts.
+
+Imports the same generated equipment CSV twice into a throwaway SQLite database: once with
+import_csv() (validated, de-duplicated, batched executemany) and once the way the add_equipment
+form does it, one ORM add and commit per row.
+
+    python benchmarks/bench_import.py --rows 20000
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+SAS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_csv(rows):
+    lines = ["name,brand,model,serial_number,status,last_maintenance_date,next_maintenance_date"]
+    for i in range(rows):
+        lines.append(f"Groupe {i},Brand {i % 17},M{i % 5},SN-{i:08d},In Service,2026-01-{1 + i % 28:02d},2027-01-{1 + i % 28:02d}")
+    return "\n".join(lines) + "\n"
+
+
+def per_row_orm(app_module, data):
+    import csv
+    from datetime import datetime
+    db, Equipment = app_module.db, app_module.Equipment
+    for row in csv.DictReader(io.StringIO(data)):
+        db.session.add(Equipment(
+            name=row['name'], brand=row['brand'], model=row['model'], serial_number=row['serial_number'], status=row['status'],
+            last_maintenance_date=datetime.strptime(row['last_maintenance_date'], '%Y-%m-%d').date(),
+            next_maintenance_date=datetime.strptime(row['next_maintenance_date'], '%Y-%m-%d').date(),
+        ))
+        db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='sas-bench-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    sys.path.insert(0, SAS_DIR)
+    import app as app_module
+    db, Equipment = app_module.db, app_module.Equipment
+    data = make_csv(args.rows)
+
+    with app_module.app.app_context():
+        app_module.db.create_all()
+        started = time.perf_counter()
+        report = app_module.import_csv('equipment', io.BytesIO(data.encode()))
+        bulk = time.perf_counter() - started
+        assert report['inserted'] == args.rows, report
+        print(f"import_csv (batched)     {bulk:8.2f} s  {args.rows / bulk:10.0f} rows/s")
+
+        db.session.query(Equipment).delete()
+        db.session.commit()
+        started = time.perf_counter()
+        per_row_orm(app_module, data)
+        orm = time.perf_counter() - started
+        print(f"per-row ORM add+commit   {orm:8.2f} s  {args.rows / orm:10.0f} rows/s")
+        db.session.remove()
+
+    print(f"Speed-up: {orm / bulk:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark of the leave calendar against years of leave history.
+
+Seeds a throwaway SQLite database with leave requests spread over many years, then times
+build_leave_calendar() and the overlap check used when requesting a leave against the naive
+approach of loading every LeaveRequest and comparing dates in Python.
+
+    python benchmarks/bench_leaves.py --leaves 200000 --years 10
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+SAS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def seed(app_module, employees, leaves, years):
+    db, Employee, LeaveRequest = app_module.db, app_module.Employee, app_module.LeaveRequest
+    db.session.execute(Employee.__table__.insert(), [
+        {'full_name': f"Employee {i}", 'position': 'Technicien', 'hire_date': date(2010, 1, 1), 'is_active': True}
+        for i in range(employees)
+    ])
+    rng, start, span = random.Random(42), date.today() - timedelta(days=365 * years), 365 * years
+    batch = []
+    for _ in range(leaves):
+        first = start + timedelta(days=rng.randrange(span))
+        batch.append({'employee_id': 1 + rng.randrange(employees), 'leave_type': 'Annual Leave', 'start_date': first,
+                      'end_date': first + timedelta(days=rng.choice([0, 0, 1, 2, 4, 9, 14])),
+                      'status': rng.choice(['Approved', 'Approved', 'Pending', 'Rejected'])})
+        if len(batch) == 10000:
+            db.session.execute(LeaveRequest.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(LeaveRequest.__table__.insert(), batch)
+    db.session.commit()
+
+
+def naive_month(app_module, first, last):
+    return [leave for leave in app_module.LeaveRequest.query.all()
+            if leave.status in ('Approved', 'Pending') and leave.start_date <= last and leave.end_date >= first]
+
+
+def timed(fn, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--leaves', type=int, default=200000)
+    parser.add_argument('--employees', type=int, default=300)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='sas-bench-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    sys.path.insert(0, SAS_DIR)
+    import app as app_module
+
+    with app_module.app.app_context():
+        app_module.db.create_all()
+        seed(app_module, args.employees, args.leaves, args.years)
+        today = date.today()
+        first = today.replace(day=1)
+        last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+
+        calendar_ms, (_, rows, _) = timed(lambda: app_module.build_leave_calendar(first.year, first.month), args.repeat)
+        app_module.db.session.expire_all()
+        overlap_ms, _ = timed(lambda: app_module.overlapping_leaves(today, today + timedelta(days=7), employee_id=1).all(), args.repeat)
+        naive_ms, naive = timed(lambda: naive_month(app_module, first, last), max(1, args.repeat // 5))
+        print(f"build_leave_calendar      {calendar_ms:9.2f} ms  ({len(rows)} employees off this month)")
+        print(f"overlap check (1 employee){overlap_ms:9.2f} ms")
+        print(f"load all + filter month   {naive_ms:9.2f} ms  ({len(naive)} leaves)")
+        print(f"Speed-up (calendar): {naive_ms / calendar_ms:.1f}x")
+        app_module.db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
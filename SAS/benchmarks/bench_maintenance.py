@@ -0,0 +1,91 @@
+"""Benchmark of the maintenance scheduler on a large fleet.
+
+Seeds a throwaway SQLite database with equipment of many brands and models, then times the
+batch rescheduling of the whole fleet (first run, which also creates the overdue alerts, and an
+unchanged re-run), the "due this week" lookup with and without the
+ix_equipment_next_maintenance_id index, and building the weekly plan.
+
+    python benchmarks/bench_maintenance.py --equipment 200000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+SAS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BRANDS = ['Atlas', 'Kubota', 'Honda', 'Makita', 'Hilti', 'Bosch', 'Wacker', 'Caterpillar']
+
+
+def seed(app_module, equipment):
+    db, Equipment, MaintenanceInterval = app_module.db, app_module.Equipment, app_module.MaintenanceInterval
+    rng, today = random.Random(42), date.today()
+    db.session.execute(MaintenanceInterval.__table__.insert(), [
+        {'brand': brand, 'model': f'M{model}' if model else '', 'interval_days': rng.choice([30, 90, 180, 365]),
+         'duration_hours': rng.choice([1, 2, 4, 8])}
+        for brand in BRANDS for model in range(4)
+    ])
+    batch = []
+    for i in range(equipment):
+        batch.append({'name': f"Machine {i}", 'brand': rng.choice(BRANDS), 'model': f'M{rng.randrange(6)}',
+                      'serial_number': f'SN{i:08d}', 'status': 'In Service',
+                      'last_maintenance_date': today - timedelta(days=rng.randrange(400))})
+        if len(batch) == 10000:
+            db.session.execute(Equipment.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(Equipment.__table__.insert(), batch)
+    db.session.commit()
+
+
+def timed(fn, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--equipment', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='sas-bench-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    sys.path.insert(0, SAS_DIR)
+    import app as app_module
+
+    with app_module.app.app_context():
+        db = app_module.db
+        db.create_all()
+        seed(app_module, args.equipment)
+        today = date.today()
+        week_start = today - timedelta(days=today.weekday())
+        week_end = week_start + timedelta(days=6)
+
+        schedule_ms, changed = timed(app_module.schedule_maintenance, 1)
+        rerun_ms, _ = timed(app_module.schedule_maintenance, 1)
+        Equipment = app_module.Equipment
+        due_week = lambda: db.session.execute(app_module.maintenance_queue(week_end).with_only_columns(
+            Equipment.id, Equipment.next_maintenance_date).where(Equipment.next_maintenance_date >= week_start)).all()
+        indexed_ms, due = timed(due_week, args.repeat)
+        plan_ms, (_, _, unplanned) = timed(lambda: app_module.build_maintenance_plan(week_start, week_start), args.repeat)
+        later_ms, _ = timed(lambda: app_module.build_maintenance_plan(week_start + timedelta(weeks=52), week_start), 1)
+        db.session.execute(app_module.text('DROP INDEX ix_equipment_next_maintenance_id'))
+        scan_ms, _ = timed(due_week, args.repeat)
+        print(f"schedule_maintenance      {schedule_ms:9.2f} ms  ({changed} dates set, alerts created)")
+        print(f"schedule_maintenance again{rerun_ms:9.2f} ms  (nothing to change)")
+        print(f"due this week (index)     {indexed_ms:9.2f} ms  ({len(due)} jobs)")
+        print(f"due this week (scan)      {scan_ms:9.2f} ms")
+        print(f"build_maintenance_plan    {plan_ms:9.2f} ms  ({unplanned} jobs over capacity)")
+        print(f"plan a year ahead         {later_ms:9.2f} ms  (simulated from this week)")
+        print(f"Speed-up (due this week): {scan_ms / indexed_ms:.1f}x")
+        db.session.rollback()
+        db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark of the global search at 100k+ rows.
+
+Seeds a throwaway SQLite database with clients, equipment, quotes and candidates, builds the
+search index and times a set of queries against each available backend.
+
+    python benchmarks/bench_search.py --clients 100000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+SAS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+QUERIES = ['dupont', 'SN-0000042', 'caterpilar', 'DEV-2026-01', 'soudure', 'ab', '06 12']
+
+
+def seed(app_module, clients):
+    db, rng = app_module.db, random.Random(7)
+    names = ['Dupont', 'Martin', 'Bernard', 'Durand', 'Lefebvre', 'Moreau', 'Garnier', 'Faure', 'Rousseau', 'Blanc']
+    brands = ['Caterpillar', 'Kohler', 'SDMO', 'Atlas Copco', 'Perkins']
+    db.session.execute(app_module.Client.__table__.insert(), [
+        {'name': f"{rng.choice(names)} {i}", 'email': f"contact{i}@example.fr", 'phone': f"06 {i % 100:02d} {i % 97:02d} {i % 89:02d}",
+         'status': 'Prospect', 'last_contact_date': datetime(2026, 1, 1)} for i in range(clients)])
+    db.session.execute(app_module.Equipment.__table__.insert(), [
+        {'name': f"Groupe {i}", 'brand': rng.choice(brands), 'model': f"X{i % 50}", 'serial_number': f"SN-{i:08d}", 'status': 'In Service'}
+        for i in range(clients // 5)])
+    db.session.execute(app_module.Quote.__table__.insert(), [
+        {'quote_number': f"DEV-2026-{i:05d}", 'client_id': 1 + i % clients, 'service_type': 'Maintenance', 'details': rng.choice(['soudure', 'vidange', 'révision']),
+         'price': 100.0, 'vat_rate': 0.2, 'status': 'Pending', 'created_at': datetime(2026, 1, 1), 'expires_at': datetime(2026, 2, 1)}
+        for i in range(clients // 5)])
+    db.session.execute(app_module.Candidate.__table__.insert(), [
+        {'full_name': f"{rng.choice(names)} Candidat {i}", 'email': f"cand{i}@example.fr", 'position_applied_for': 'Technicien',
+         'status': 'Applied', 'notes': rng.choice(['soudure TIG', 'électricité', None])} for i in range(clients // 10)])
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clients', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='sas-bench-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    sys.path.insert(0, SAS_DIR)
+    import app as app_module
+
+    with app_module.app.app_context(), app_module.app.test_request_context():
+        app_module.db.create_all()
+        seed(app_module, args.clients)
+        total = args.clients + args.clients // 5 * 2 + args.clients // 10
+        for backend in ('sqlite_fts', 'memory'):
+            app_module.app.config['SEARCH_BACKEND'] = backend
+            app_module._search_backend = None
+            started = time.perf_counter()
+            with app_module.db.engine.begin() as connection:
+                app_module.get_search_backend(connection).rebuild(connection)
+            app_module.search('warm-up')
+            print(f"[{backend}] indexed {total} rows in {time.perf_counter() - started:.1f} s")
+            for q in QUERIES:
+                timings, count = [], 0
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    count = len(app_module.search(q))
+                    timings.append((time.perf_counter() - started) * 1000)
+                print(f"  {q!r:<16} median {statistics.median(timings):7.2f} ms  max {max(timings):7.2f} ms  {count} results")
+        app_module.db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
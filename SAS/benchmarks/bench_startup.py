@@ -0,0 +1,118 @@
+"""Benchmark of worker start-up time.
+
+Starts fresh Python processes against a prepared SQLite database and measures, per boot mode,
+the time until the app is importable and until it has served its first request. The "legacy"
+mode repeats the work every worker used to do at import (Flask-Migrate, create_all and the
+admin lookup).
+When gunicorn is installed, also times a server boot to its first response, with and without
+preload_app.
+
+    python benchmarks/bench_startup.py --repeat 5
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+SAS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {sas_dir!r})
+import app
+timings = {{'import': time.perf_counter() - started}}
+if {legacy}:
+    app.get_migrate()
+    with app.app.app_context():
+        app.db.create_all()
+        app.User.query.filter_by(username='admin').first()
+    timings['init'] = time.perf_counter() - started
+app.create_app()
+timings['create_app'] = time.perf_counter() - started
+response = app.app.test_client().get('/login')
+assert response.status_code == 200, response.status_code
+timings['first_request'] = time.perf_counter() - started
+pdf_started = time.perf_counter()
+import pdf_render
+pdf_render.warm_up()
+timings['weasyprint_import'] = time.perf_counter() - pdf_started
+print(json.dumps(timings))
+"""
+
+MODES = {
+    'lazy': ({'PRELOAD_HEAVY_IMPORTS': '0'}, False),
+    'preload': ({'PRELOAD_HEAVY_IMPORTS': '1', 'PDF_RENDER_WORKERS': '0'}, False),
+    'legacy (init at import)': ({'PRELOAD_HEAVY_IMPORTS': '0'}, True),
+}
+
+
+def boot(env, legacy):
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', CHILD.format(sas_dir=SAS_DIR, legacy=legacy)],
+                            env=env, capture_output=True, text=True, check=True).stdout
+    timings = json.loads(output.strip().splitlines()[-1])
+    timings['process'] = time.perf_counter() - started
+    return timings
+
+
+def gunicorn_boot(env, preload, workers):
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--workers', str(workers), '--bind', f'127.0.0.1:{port}', '--log-level', 'warning']
+        + (['--preload'] if preload else []) + ['app:create_app()'], cwd=SAS_DIR, env=env)
+    try:
+        while True:
+            try:
+                urllib.request.urlopen(f'http://127.0.0.1:{port}/login', timeout=2).close()
+                return time.perf_counter() - started
+            except OSError:
+                if process.poll() is not None or time.perf_counter() - started > 60:
+                    raise SystemExit("gunicorn did not start")
+                time.sleep(0.02)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=4, help="gunicorn workers")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='sas-bench-')
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'bench.db')}", ALERT_RECONCILE_INTERVAL='0')
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'app', 'init-db'], cwd=SAS_DIR, env=env,
+                   check=True, capture_output=True)
+
+    print(f"{'mode':<26}{'process':>10}{'import':>10}{'ready':>10}{'1st req':>10}   (median ms over {args.repeat} boots)")
+    medians = {}
+    for name, (overrides, legacy) in MODES.items():
+        runs = [boot(dict(env, **overrides), legacy) for _ in range(args.repeat)]
+        medians[name] = {key: statistics.median(run[key] for run in runs) * 1000 for key in runs[0]}
+        m = medians[name]
+        print(f"{name:<26}{m['process']:>10.0f}{m['import']:>10.0f}{m['create_app']:>10.0f}{m['first_request']:>10.0f}")
+    print(f"WeasyPrint import paid by the first PDF when lazy: {medians['lazy']['weasyprint_import']:.0f} ms")
+
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        print("gunicorn is not installed; skipping the server boot benchmark")
+        return
+    for preload in (False, True):
+        times = [gunicorn_boot(env, preload, args.workers) for _ in range(args.repeat)]
+        print(f"gunicorn {args.workers} workers, preload={preload}: first response after {statistics.median(times) * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark of the timesheet report against a naive per-object computation.
+
+Seeds a throwaway SQLite database with attendance logs, then times build_timesheet() (SQL
+aggregation per employee-day) and the equivalent loop over AttendanceLog objects.
+
+    python benchmarks/bench_timesheet.py --logs 300000 --employees 200
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+SAS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def seed(app_module, employees, logs, start):
+    db, Employee, AttendanceLog = app_module.db, app_module.Employee, app_module.AttendanceLog
+    db.session.execute(Employee.__table__.insert(), [
+        {'full_name': f"Employee {i}", 'position': 'Technicien', 'hire_date': start, 'is_active': True}
+        for i in range(employees)
+    ])
+    employee_ids = [row[0] for row in db.session.query(Employee.id)]
+    rng = random.Random(42)
+    batch, clocked_in = [], set()
+    for i in range(logs):
+        day = start + timedelta(days=i * 180 // logs)
+        entry = datetime.combine(day, datetime.min.time()) + timedelta(hours=rng.choice([6, 8, 14, 22]), minutes=rng.randrange(60))
+        employee_id = rng.choice(employee_ids)
+        # About 1% of shifts stay open, at most one per employee (see ix_attendance_log_open_employee).
+        if rng.random() > 0.01 or employee_id in clocked_in:
+            exit_ = entry + timedelta(hours=rng.uniform(4, 10))
+        else:
+            exit_ = None
+            clocked_in.add(employee_id)
+        batch.append({'employee_id': employee_id, 'work_date': day, 'entry_time': entry, 'exit_time': exit_})
+        if len(batch) == 10000:
+            db.session.execute(AttendanceLog.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(AttendanceLog.__table__.insert(), batch)
+    db.session.commit()
+
+
+def naive_timesheet(app_module, date_from, date_to):
+    """Per-object reference implementation: one AttendanceLog instance per row, summed in Python."""
+    AttendanceLog = app_module.AttendanceLog
+    totals = {}
+    logs = AttendanceLog.query.filter(AttendanceLog.work_date >= date_from, AttendanceLog.work_date <= date_to)
+    for log in logs:
+        if log.exit_time:
+            key = (log.employee.full_name, log.work_date - timedelta(days=log.work_date.weekday()))
+            totals[key] = totals.get(key, 0.0) + (log.exit_time - log.entry_time).total_seconds() / 3600
+    return totals
+
+
+def timed(label, func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<24} {best * 1000:10.1f} ms (best of {repeat})")
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--logs', type=int, default=300000)
+    parser.add_argument('--employees', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='sas-bench-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    sys.path.insert(0, SAS_DIR)
+    import app as app_module
+
+    start = date(2026, 1, 5)
+    with app_module.app.app_context():
+        app_module.db.create_all()
+        started = time.perf_counter()
+        seed(app_module, args.employees, args.logs, start)
+        print(f"Seeded {args.logs} logs for {args.employees} employees in {time.perf_counter() - started:.1f} s")
+        date_from, date_to = start, start + timedelta(days=179)
+        rows, fast = timed('build_timesheet (SQL)', lambda: app_module.build_timesheet(date_from, date_to, 'week'), args.repeat)
+        totals, slow = timed('per-object Python', lambda: naive_timesheet(app_module, date_from, date_to), args.repeat)
+        app_module.db.session.remove()
+
+    assert abs(sum(r['hours'] for r in rows) - sum(totals.values())) < 1, "implementations disagree"
+    print(f"Speed-up: {slow / fast:.1f}x over {len(rows)} employee-weeks")
+
+
+if __name__ == '__main__':
+    main()
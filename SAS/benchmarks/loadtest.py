@@ -0,0 +1,355 @@
+"""Load test of the hot routes against a realistically sized database.
+
+Seeds SQLite (or the database given with --database-url, e.g. a local PostgreSQL) with
+--scale times 50k clients, 200k quotes and 1M attendance logs, then drives either the Flask
+test client or a local gunicorn with concurrent logged-in sessions. For every scenario it
+reports p50/p95/p99 latency, throughput and SQL statements per request (X-Query-Count).
+Results can be stored as a baseline; a later run with --compare exits non-zero on regressions.
+
+    python benchmarks/loadtest.py --scale 0.1 --save-baseline benchmarks/baseline.json
+    python benchmarks/loadtest.py --scale 0.1 --compare benchmarks/baseline.json
+    python benchmarks/loadtest.py --target gunicorn --workers 4 --concurrency 16
+"""
+import argparse
+import http.cookiejar
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime, date, timedelta
+
+SAS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VOLUMES = {'clients': 50000, 'quotes': 200000, 'equipment': 10000, 'employees': 500,
+           'attendance_logs': 1000000, 'leave_requests': 5000, 'candidates': 5000}
+SCENARIOS = ['dashboard', 'list_quotes', 'attendance', 'clock_in_out', 'generate_quote_pdf']
+EXTRA_SCENARIOS = ['add_quote']
+CHUNK = 10000
+
+
+# --- SEEDING ---
+
+def _insert(db, table, rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= CHUNK:
+            db.session.execute(table.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(table.insert(), batch)
+
+def seed(app_module, scale):
+    """Bulk-loads the tables; returns the row counts actually inserted."""
+    db, rng = app_module.db, random.Random(42)
+    counts = {name: max(1, int(volume * scale)) for name, volume in VOLUMES.items()}
+    today, now = date.today(), datetime.utcnow()
+    names = ['Dupont', 'Martin', 'Bernard', 'Durand', 'Lefebvre', 'Moreau', 'Garnier', 'Faure', 'Rousseau', 'Blanc']
+    statuses = ['Prospect', 'Client', 'Inactif']
+
+    _insert(db, app_module.Client.__table__, (
+        {'name': f"{rng.choice(names)} {i}", 'email': f"contact{i}@example.fr", 'phone': f"06 {i % 100:02d} {i % 97:02d}",
+         'address': f"{i} rue de la Paix", 'status': rng.choice(statuses), 'last_contact_date': now - timedelta(days=rng.randrange(900))}
+        for i in range(counts['clients'])))
+    _insert(db, app_module.Equipment.__table__, (
+        {'name': f"Groupe {i}", 'brand': rng.choice(['Caterpillar', 'Kohler', 'SDMO', 'Perkins']), 'model': f"X{i % 50}",
+         'serial_number': f"SN-{i:08d}", 'status': rng.choice(['In Service', 'In Service', 'Under Maintenance']),
+         'last_maintenance_date': today - timedelta(days=rng.randrange(365)),
+         'next_maintenance_date': today + timedelta(days=rng.randrange(-30, 365)),
+         'assigned_client_id': 1 + rng.randrange(counts['clients'])}
+        for i in range(counts['equipment'])))
+    _insert(db, app_module.Quote.__table__, (
+        {'quote_number': f"DEV-{(now - timedelta(days=i % 1000)).year}-B{i:07d}", 'client_id': 1 + rng.randrange(counts['clients']),
+         'service_type': rng.choice(['Maintenance', 'Installation', 'Réparation']), 'details': 'Intervention sur site',
+         'price': round(rng.uniform(200, 20000), 2), 'vat_rate': 0.2, 'status': rng.choice(['Pending', 'Accepted', 'Rejected']),
+         'created_at': now - timedelta(days=i % 1000), 'expires_at': now - timedelta(days=i % 1000) + timedelta(days=30)}
+        for i in range(counts['quotes'])))
+    _insert(db, app_module.Employee.__table__, (
+        {'full_name': f"{rng.choice(names)} Employé {i}", 'position': 'Technicien', 'email': f"emp{i}@example.fr",
+         'hire_date': today - timedelta(days=rng.randrange(3000)), 'is_active': i % 20 != 0}
+        for i in range(counts['employees'])))
+    def leave_rows():
+        for _ in range(counts['leave_requests']):
+            start = today + timedelta(days=rng.randrange(-700, 200))
+            yield {'employee_id': 1 + rng.randrange(counts['employees']), 'leave_type': 'Annual Leave',
+                   'start_date': start, 'end_date': start + timedelta(days=rng.randrange(5)),
+                   'status': rng.choice(['Pending', 'Approved', 'Rejected']), 'requested_at': now}
+    _insert(db, app_module.LeaveRequest.__table__, leave_rows())
+    _insert(db, app_module.Candidate.__table__, (
+        {'full_name': f"{rng.choice(names)} Candidat {i}", 'email': f"cand{i}@example.fr", 'position_applied_for': 'Technicien',
+         'status': 'Applied'} for i in range(counts['candidates'])))
+
+    def attendance_rows():
+        # One closed shift per employee and day, ending yesterday, so clocking in today is always valid.
+        days = math.ceil(counts['attendance_logs'] / counts['employees'])
+        emitted = 0
+        for offset in range(days, 0, -1):
+            work_date = today - timedelta(days=offset)
+            for employee_id in range(1, counts['employees'] + 1):
+                if emitted == counts['attendance_logs']:
+                    return
+                entry = datetime.combine(work_date, datetime.min.time()) + timedelta(minutes=450 + rng.randrange(90))
+                yield {'employee_id': employee_id, 'work_date': work_date, 'entry_time': entry,
+                       'exit_time': entry + timedelta(minutes=420 + rng.randrange(120))}
+                emitted += 1
+    _insert(db, app_module.AttendanceLog.__table__, attendance_rows())
+    db.session.commit()
+
+    app_module.reconcile_alerts()
+    with db.engine.begin() as connection:
+        app_module.get_search_backend(connection).rebuild(connection)
+    return counts
+
+def _already_seeded(app_module):
+    return app_module.db.session.query(app_module.Client.id).limit(1).first() is not None
+
+
+# --- SESSIONS ---
+
+class TestClientSession:
+    """Drives the app in-process through the Flask test client."""
+    def __init__(self, app_module):
+        self.client = app_module.app.test_client()
+        self.request('POST', '/login', {'username': 'admin', 'password': 'admin'})
+
+    def request(self, method, path, data=None):
+        response = self.client.open(path, method=method, data=data)
+        response.close()
+        return response.status_code, response.headers.get('X-Query-Count')
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+class HttpSession:
+    """Drives a running server over HTTP with its own cookie jar, without following redirects."""
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()), _NoRedirect)
+        self.request('POST', '/login', {'username': 'admin', 'password': 'admin'})
+
+    def request(self, method, path, data=None):
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        req = urllib.request.Request(self.base_url + path, data=body, method=method)
+        try:
+            with self.opener.open(req, timeout=120) as response:
+                response.read()
+                return response.status, response.headers.get('X-Query-Count')
+        except urllib.error.HTTPError as exc:
+            exc.read()
+            return exc.code, exc.headers.get('X-Query-Count')
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_gunicorn(workers, threads, env):
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--workers', str(workers), '--threads', str(threads),
+         '--bind', f'127.0.0.1:{port}', '--log-level', 'warning', 'app:app'], cwd=SAS_DIR, env=env)
+    base_url = f'http://127.0.0.1:{port}'
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"gunicorn exited with status {process.returncode}")
+        try:
+            urllib.request.urlopen(base_url + '/login', timeout=2).close()
+            return process, base_url
+        except OSError:
+            time.sleep(0.25)
+    process.terminate()
+    raise SystemExit("gunicorn did not start within 60 s")
+
+
+# --- SCENARIOS ---
+# Each scenario yields (name, method, path, form data, expected status) steps for one iteration;
+# worker is the thread index, so write scenarios can keep their rows apart between threads.
+
+def scenario_steps(name, rng, worker, concurrency, counts):
+    if name == 'dashboard':
+        yield 'dashboard', 'GET', '/', None, 200
+    elif name == 'list_quotes':
+        yield 'list_quotes', 'GET', rng.choice(['/quotes', '/quotes?status=Pending']), None, 200
+    elif name == 'attendance':
+        yield 'attendance', 'GET', '/attendance', None, 200
+    elif name == 'clock_in_out':
+        employees = range(1 + worker, counts['employees'] + 1, concurrency)
+        employee_id = str(rng.choice(employees) if employees else 1)
+        yield 'clock_in', 'POST', '/attendance/clock_in', {'employee_id': employee_id}, 302
+        yield 'clock_out', 'POST', '/attendance/clock_out', {'employee_id': employee_id}, 302
+    elif name == 'generate_quote_pdf':
+        yield 'generate_quote_pdf', 'GET', f"/quote/{1 + rng.randrange(counts['quotes'])}/pdf", None, 200
+    elif name == 'add_quote':
+        yield 'add_quote', 'POST', '/quote/add', {'client_id': str(1 + rng.randrange(counts['clients'])), 'service_type': 'Maintenance',
+                                                  'details': 'Charge', 'price': '1500', 'vat_rate': '0.2'}, 302
+
+def run_scenario(name, make_session, requests, concurrency, counts, warmup):
+    samples, lock = {}, threading.Lock()
+    sessions = [make_session() for _ in range(concurrency)]
+    remaining = [requests]
+
+    def worker(index):
+        rng = random.Random(index)
+        session = sessions[index]
+        for _ in range(warmup):
+            for _step, method, path, data, _expected in scenario_steps(name, rng, index, concurrency, counts):
+                session.request(method, path, data)
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            for step, method, path, data, expected in scenario_steps(name, rng, index, concurrency, counts):
+                started = time.perf_counter()
+                status, queries = session.request(method, path, data)
+                elapsed = time.perf_counter() - started
+                with lock:
+                    samples.setdefault(step, []).append((elapsed, status == expected, queries))
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+    return {step: summarize(step_samples, wall) for step, step_samples in samples.items()}
+
+def _percentile(values, percent):
+    return values[max(0, math.ceil(percent / 100 * len(values)) - 1)]
+
+def summarize(samples, wall):
+    latencies = sorted(elapsed * 1000 for elapsed, ok, _ in samples if ok)
+    queries = [int(count) for _, ok, count in samples if ok and count is not None]
+    result = {'requests': len(samples), 'errors': sum(1 for _, ok, _ in samples if not ok),
+              'throughput_rps': round(len(samples) / wall, 1) if wall else None}
+    if latencies:
+        result.update({'p50_ms': round(_percentile(latencies, 50), 2), 'p95_ms': round(_percentile(latencies, 95), 2),
+                       'p99_ms': round(_percentile(latencies, 99), 2), 'mean_ms': round(sum(latencies) / len(latencies), 2)})
+    result['queries_per_request'] = round(sum(queries) / len(queries), 2) if queries else None
+    return result
+
+
+# --- REPORTING ---
+
+def print_report(results):
+    print(f"{'scenario':<20}{'reqs':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>9}{'queries':>9}")
+    for step, r in results.items():
+        def fmt(key):
+            return '-' if r.get(key) is None else f"{r[key]:g}"
+        print(f"{step:<20}{r['requests']:>7}{r['errors']:>8}{fmt('p50_ms'):>10}{fmt('p95_ms'):>10}"
+              f"{fmt('p99_ms'):>10}{fmt('throughput_rps'):>9}{fmt('queries_per_request'):>9}")
+
+def compare(results, baseline, tolerance, min_delta_ms, query_tolerance):
+    """Returns the list of regressions of `results` against a stored baseline run."""
+    regressions = []
+    for step, base in baseline['scenarios'].items():
+        current = results.get(step)
+        if current is None:
+            continue
+        for key in ('p50_ms', 'p95_ms'):
+            if base.get(key) is None or current.get(key) is None:
+                continue
+            if current[key] > base[key] * (1 + tolerance) and current[key] - base[key] > min_delta_ms:
+                regressions.append(f"{step}: {key} {base[key]:g} -> {current[key]:g}")
+        if base.get('queries_per_request') is not None and current.get('queries_per_request') is not None:
+            if current['queries_per_request'] > base['queries_per_request'] + query_tolerance:
+                regressions.append(f"{step}: queries/request {base['queries_per_request']:g} -> {current['queries_per_request']:g}")
+        if current['errors'] / current['requests'] > base['errors'] / base['requests']:
+            regressions.append(f"{step}: error rate {base['errors']}/{base['requests']} -> {current['errors']}/{current['requests']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', help="database to seed and test (default: a throwaway SQLite file)")
+    parser.add_argument('--scale', type=float, default=1.0, help="multiplier applied to the default volumes")
+    parser.add_argument('--target', choices=['client', 'gunicorn'], default='client')
+    parser.add_argument('--workers', type=int, default=2, help="gunicorn worker processes")
+    parser.add_argument('--threads', type=int, default=4, help="threads per gunicorn worker")
+    parser.add_argument('--concurrency', type=int, default=4, help="concurrent logged-in sessions")
+    parser.add_argument('--requests', type=int, default=200, help="measured iterations per scenario")
+    parser.add_argument('--warmup', type=int, default=5, help="unmeasured iterations per session")
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help=f"comma-separated, from {', '.join(SCENARIOS + EXTRA_SCENARIOS)}")
+    parser.add_argument('--output', help="write the results as JSON")
+    parser.add_argument('--save-baseline', help="write the results as the baseline JSON")
+    parser.add_argument('--compare', help="baseline JSON; exit 1 when a scenario regressed")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed relative latency increase")
+    parser.add_argument('--min-delta-ms', type=float, default=2.0, help="ignore latency increases smaller than this")
+    parser.add_argument('--query-tolerance', type=float, default=0.0, help="allowed increase in queries/request")
+    args = parser.parse_args()
+    scenarios = [name for name in args.scenarios.split(',') if name]
+    unknown = set(scenarios) - set(SCENARIOS + EXTRA_SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    workdir = tempfile.mkdtemp(prefix='sas-load-')
+    os.environ['DATABASE_URL'] = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ.setdefault('PDF_CACHE_DIR', os.path.join(workdir, 'pdf_cache'))
+    os.environ.setdefault('ALERT_RECONCILE_INTERVAL', '0')
+    sys.path.insert(0, SAS_DIR)
+    import app as app_module
+
+    with app_module.app.app_context():
+        app_module.init_db()
+        app_module.ensure_admin_user('admin')
+        if _already_seeded(app_module):
+            counts = {name: max(1, int(volume * args.scale)) for name, volume in VOLUMES.items()}
+            print("Database already populated, skipping the seed")
+        else:
+            started = time.perf_counter()
+            counts = seed(app_module, args.scale)
+            print(f"Seeded {', '.join(f'{n} {k}' for k, n in counts.items())} in {time.perf_counter() - started:.1f} s")
+        dialect = app_module.db.engine.dialect.name
+        app_module.db.session.remove()
+
+    server = None
+    if args.target == 'gunicorn':
+        server, base_url = start_gunicorn(args.workers, args.threads, dict(os.environ))
+        make_session = lambda: HttpSession(base_url)
+    else:
+        make_session = lambda: TestClientSession(app_module)
+
+    results = {}
+    try:
+        for name in scenarios:
+            results.update(run_scenario(name, make_session, args.requests, args.concurrency, counts, args.warmup))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    print_report(results)
+
+    report = {'meta': {'target': args.target, 'database': dialect, 'scale': args.scale, 'concurrency': args.concurrency,
+                       'requests': args.requests, 'python': platform.python_version(),
+                       'recorded_at': datetime.utcnow().isoformat(timespec='seconds')},
+              'scenarios': results}
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"Results written to {path}")
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms, args.query_tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regression against {args.compare}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+"""Gunicorn settings for the SAS app; run `flask init-db` before starting the server.
+
+    gunicorn            # from the SAS directory; picks up this file
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 10000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+wsgi_app = 'app:create_app()'
+# Importing the app in the master lets workers fork with the modules already loaded; this is safe
+# because importing app.py opens no database connection and starts no thread or process.
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') != '0'
+
+
+def post_fork(server, worker):
+    import app
+    app.warm_up_worker()
@@ -0,0 +1,30 @@
+"""quote number counter
+
+Revision ID: 5b9e2d7c41a8
+Revises: a3c1f0e2b7d4
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b9e2d7c41a8'
+down_revision = 'a3c1f0e2b7d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'quote_number_counter',
+        sa.Column('year', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('last_value', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('year'),
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_table('quote_number_counter')
@@ -0,0 +1,32 @@
+"""attendance open log index
+
+Revision ID: 7d1a5e9c3b26
+Revises: e2f7b3c95d10
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d1a5e9c3b26'
+down_revision = 'e2f7b3c95d10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Racing clock-ins may have left several open shifts for one employee; keep the latest and
+    # close the others as zero-length shifts so the unique index can be built.
+    op.execute(
+        "UPDATE attendance_log SET exit_time = entry_time WHERE exit_time IS NULL AND id NOT IN "
+        "(SELECT max(id) FROM attendance_log WHERE exit_time IS NULL GROUP BY employee_id)"
+    )
+    op.create_index('ix_attendance_log_open_employee', 'attendance_log', ['employee_id'], unique=True,
+                    sqlite_where=sa.text('exit_time IS NULL'), postgresql_where=sa.text('exit_time IS NULL'),
+                    if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_attendance_log_open_employee', table_name='attendance_log', if_exists=True)
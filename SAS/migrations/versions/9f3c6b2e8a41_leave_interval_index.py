@@ -0,0 +1,53 @@
+"""leave interval index
+
+Revision ID: 9f3c6b2e8a41
+Revises: 7d1a5e9c3b26
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9f3c6b2e8a41'
+down_revision = '7d1a5e9c3b26'
+branch_labels = None
+depends_on = None
+
+
+# Must match LEAVE_INTERVAL_DDL in app.py.
+DAY = "CAST(julianday({}) AS INTEGER)"
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS leave_request_interval USING rtree_i32(id, start_day, end_day)",
+    "CREATE TRIGGER IF NOT EXISTS leave_request_interval_insert AFTER INSERT ON leave_request BEGIN "
+    f"INSERT INTO leave_request_interval VALUES (new.id, {DAY.format('new.start_date')}, {DAY.format('new.end_date')}); END",
+    "CREATE TRIGGER IF NOT EXISTS leave_request_interval_update AFTER UPDATE OF start_date, end_date ON leave_request BEGIN "
+    f"UPDATE leave_request_interval SET start_day = {DAY.format('new.start_date')}, "
+    f"end_day = {DAY.format('new.end_date')} WHERE id = new.id; END",
+    "CREATE TRIGGER IF NOT EXISTS leave_request_interval_delete AFTER DELETE ON leave_request BEGIN "
+    "DELETE FROM leave_request_interval WHERE id = old.id; END",
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_leave_request_period_gist ON leave_request "
+                   "USING gist (daterange(start_date, end_date, '[]'), employee_id)")
+    elif dialect == 'sqlite':
+        for statement in SQLITE_DDL:
+            op.execute(statement)
+        op.execute("DELETE FROM leave_request_interval")
+        op.execute(f"INSERT INTO leave_request_interval SELECT id, {DAY.format('start_date')}, {DAY.format('end_date')} FROM leave_request")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_leave_request_period_gist")
+    elif dialect == 'sqlite':
+        for name in ('insert', 'update', 'delete'):
+            op.execute(f"DROP TRIGGER IF EXISTS leave_request_interval_{name}")
+        op.execute("DROP TABLE IF EXISTS leave_request_interval")
@@ -0,0 +1,46 @@
+"""list pagination and alert indexes
+
+Revision ID: a3c1f0e2b7d4
+Revises: 
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c1f0e2b7d4'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns). Databases created with db.create_all() may already have
+# these, so they are created with IF NOT EXISTS.
+INDEXES = [
+    ('ix_alert_category_related', 'alert', ['category', 'related_id']),
+    ('ix_alert_active_due', 'alert', ['is_dismissed', 'due_date']),
+    ('ix_client_name_id', 'client', ['name', 'id']),
+    ('ix_client_status_name_id', 'client', ['status', 'name', 'id']),
+    ('ix_equipment_status_id', 'equipment', ['status', 'id']),
+    ('ix_quote_created_at_id', 'quote', ['created_at', 'id']),
+    ('ix_quote_status_created_at_id', 'quote', ['status', 'created_at', 'id']),
+    ('ix_quote_client_created_at', 'quote', ['client_id', 'created_at']),
+    ('ix_employee_active_name_id', 'employee', ['is_active', 'full_name', 'id']),
+    ('ix_leave_request_start_date_id', 'leave_request', ['start_date', 'id']),
+    ('ix_leave_request_status_start_date_id', 'leave_request', ['status', 'start_date', 'id']),
+    ('ix_leave_request_employee_start_date', 'leave_request', ['employee_id', 'start_date']),
+    ('ix_candidate_application_date_id', 'candidate', ['application_date', 'id']),
+    ('ix_candidate_status_application_date_id', 'candidate', ['status', 'application_date', 'id']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade():
+    for name, table, columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
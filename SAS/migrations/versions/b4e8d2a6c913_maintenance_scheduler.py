@@ -0,0 +1,36 @@
+"""maintenance scheduler
+
+Revision ID: b4e8d2a6c913
+Revises: 9f3c6b2e8a41
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4e8d2a6c913'
+down_revision = '9f3c6b2e8a41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'maintenance_interval',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('brand', sa.String(length=80), nullable=False),
+        sa.Column('model', sa.String(length=80), nullable=False),
+        sa.Column('interval_days', sa.Integer(), nullable=False),
+        sa.Column('duration_hours', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('brand', 'model', name='uq_maintenance_interval_brand_model'),
+        if_not_exists=True,
+    )
+    op.create_index('ix_equipment_next_maintenance_id', 'equipment', ['next_maintenance_date', 'id'], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_equipment_next_maintenance_id', table_name='equipment', if_exists=True)
+    op.drop_table('maintenance_interval')
@@ -0,0 +1,24 @@
+"""attendance work date index
+
+Revision ID: c8d4a19e6f02
+Revises: 5b9e2d7c41a8
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8d4a19e6f02'
+down_revision = '5b9e2d7c41a8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_attendance_log_work_date_employee', 'attendance_log', ['work_date', 'employee_id'], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_attendance_log_work_date_employee', table_name='attendance_log', if_exists=True)
@@ -0,0 +1,35 @@
+"""maintenance derived dates
+
+Revision ID: d5f1c8a2e7b4
+Revises: b4e8d2a6c913
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5f1c8a2e7b4'
+down_revision = 'b4e8d2a6c913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing dates are treated as set by hand, so rescheduling never moves them.
+    if 'next_maintenance_derived' not in {column['name'] for column in sa.inspect(op.get_bind()).get_columns('equipment')}:
+        with op.batch_alter_table('equipment') as batch_op:
+            batch_op.add_column(sa.Column('next_maintenance_derived', sa.Boolean(), nullable=False, server_default=sa.false()))
+    # Rules are matched case-insensitively: keep the latest of each case variant, then store
+    # brand and model lower-cased so the unique constraint applies to the normalised key.
+    op.execute(
+        "DELETE FROM maintenance_interval WHERE id NOT IN (SELECT max(id) FROM maintenance_interval "
+        "GROUP BY lower(trim(brand)), lower(trim(model)))"
+    )
+    op.execute("UPDATE maintenance_interval SET brand = lower(trim(brand)), model = lower(trim(model))")
+
+
+def downgrade():
+    with op.batch_alter_table('equipment') as batch_op:
+        batch_op.drop_column('next_maintenance_derived')
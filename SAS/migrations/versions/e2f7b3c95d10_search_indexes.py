@@ -0,0 +1,49 @@
+"""search indexes
+
+Revision ID: e2f7b3c95d10
+Revises: c8d4a19e6f02
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2f7b3c95d10'
+down_revision = 'c8d4a19e6f02'
+branch_labels = None
+depends_on = None
+
+
+# (table, rowid code, document expression); must match SEARCH_ENTITIES in app.py.
+DOCUMENTS = [
+    ('client', 1, "coalesce(name, '') || ' ' || coalesce(email, '') || ' ' || coalesce(phone, '')"),
+    ('equipment', 2, "coalesce(name, '') || ' ' || coalesce(serial_number, '') || ' ' || coalesce(brand, '') || ' ' || coalesce(model, '')"),
+    ('quote', 3, "coalesce(quote_number, '') || ' ' || coalesce(details, '')"),
+    ('candidate', 4, "coalesce(full_name, '') || ' ' || coalesce(notes, '')"),
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table, _, document in DOCUMENTS:
+            op.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_search_trgm ON {table} USING gin (({document}) gin_trgm_ops)")
+            op.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_search_tsv ON {table} USING gin (to_tsvector('simple', {document}))")
+    elif dialect == 'sqlite':
+        op.execute("CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(body, tokenize='trigram')")
+        op.execute("DELETE FROM search_index")
+        for table, code, document in DOCUMENTS:
+            op.execute(f"INSERT INTO search_index (rowid, body) SELECT ({code} << 40) | id, {document} FROM {table}")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for table, _, _ in DOCUMENTS:
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_tsv")
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_trgm")
+    elif dialect == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS search_index")
@@ -0,0 +1,29 @@
+"""unique alert key
+
+Revision ID: f6a2d9c4b1e3
+Revises: d5f1c8a2e7b4
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6a2d9c4b1e3'
+down_revision = 'd5f1c8a2e7b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Concurrent writers may already have inserted the same alert twice: keep the latest one.
+    op.execute(
+        "DELETE FROM alert WHERE id NOT IN (SELECT max(id) FROM alert GROUP BY category, related_id)"
+    )
+    op.drop_index('ix_alert_category_related', table_name='alert', if_exists=True)
+    op.create_index('ix_alert_category_related', 'alert', ['category', 'related_id'], unique=True, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_alert_category_related', table_name='alert', if_exists=True)
+    op.create_index('ix_alert_category_related', 'alert', ['category', 'related_id'], if_not_exists=True)
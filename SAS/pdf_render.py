@@ -0,0 +1,21 @@
+"""PDF rendering entry points executed inside the PDF worker processes.
+
+This module is imported by the worker processes spawned from app.py, so it must stay free
+of any Flask application or database setup.
+"""
+
+
+def render_pdf(html, base_url=None):
+    """Renders an HTML document to PDF bytes with WeasyPrint."""
+    # Imported here so that only the worker processes pay for WeasyPrint's heavy import.
+    from weasyprint import HTML
+    return HTML(string=html, base_url=base_url).write_pdf()
+
+
+def warm_up():
+    """Imports WeasyPrint ahead of the first render; returns False when it cannot be loaded."""
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError):
+        return False
+    return True
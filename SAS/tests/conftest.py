@@ -0,0 +1,50 @@
+"""Shared fixtures. Run from SAS/ with `python -m pytest tests`.
+
+The app reads its configuration at import time, so the environment is set up here before
+importing it: a throwaway SQLite file (shared by threads, unlike an in-memory database), cheap
+bcrypt hashes and no background threads.
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='sas-test-'), 'test.db')}"
+os.environ['BCRYPT_LOG_ROUNDS'] = '4'
+os.environ['ALERT_RECONCILE_INTERVAL'] = '0'
+os.environ['PDF_RENDER_WORKERS'] = '0'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as sas  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    sas.app.config.update(TESTING=True, QUERY_BUDGET_MODE='raise', RESPONSE_CACHE_BACKEND='off')
+    with sas.app.app_context():
+        sas.db.create_all()
+        sas.ensure_admin_user('admin')
+    yield sas.app
+    with sas.app.app_context():
+        sas.db.session.remove()
+        with sas.db.engine.begin() as connection:
+            for table in reversed(sas.db.metadata.sorted_tables):
+                connection.execute(table.delete())
+            if sas.inspect(connection).has_table('search_index'):
+                connection.exec_driver_sql("DELETE FROM search_index")
+    sas.invalidate_user_cache()
+    with sas._kpi_cache_lock:
+        sas._kpi_cache.clear()
+
+
+def login(app):
+    client = app.test_client()
+    response = client.post('/login', data={'username': 'admin', 'password': 'admin'})
+    assert response.status_code == 302
+    return client
+
+
+@pytest.fixture
+def client(app):
+    return login(app)
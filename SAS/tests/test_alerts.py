@@ -0,0 +1,55 @@
+from datetime import date, timedelta
+
+from conftest import sas
+
+
+def maintenance_alert(equipment_id):
+    return sas.Alert.query.filter_by(category='Maintenance', related_id=equipment_id).one_or_none()
+
+
+def test_dismissed_alert_survives_reconciles_and_renames_until_its_date_moves(app, client):
+    with app.app_context():
+        item = sas.Equipment(name='Groupe 1', brand='Kohler', next_maintenance_date=date.today() + timedelta(days=5))
+        sas.db.session.add(item)
+        sas.db.session.commit()
+        equipment_id, alert_id = item.id, maintenance_alert(item.id).id
+
+    assert client.post(f'/alert/{alert_id}/dismiss').status_code == 302
+    with app.app_context():
+        sas.reconcile_alerts()
+        sas.db.session.get(sas.Equipment, equipment_id).name = 'Groupe 1 bis'
+        sas.db.session.commit()
+        assert maintenance_alert(equipment_id).is_dismissed is True
+        # Renamed behind the ORM's back, so only the reconciler updates the message.
+        table = sas.Equipment.__table__
+        sas.db.session.execute(sas.update(table).where(table.c.id == equipment_id).values(name='Groupe 1 ter'))
+        sas.db.session.commit()
+        assert sas.reconcile_alerts() == (0, 1, 0)
+        alert = maintenance_alert(equipment_id)
+        assert (alert.id, alert.message, alert.is_dismissed) == (alert_id, 'Maintenance for Groupe 1 ter (Kohler)', True)
+        assert sas.Alert.query.count() == 1
+
+        # A new due date is a new reminder; one outside the window removes the alert.
+        sas.db.session.get(sas.Equipment, equipment_id).next_maintenance_date = date.today() + timedelta(days=6)
+        sas.db.session.commit()
+        assert maintenance_alert(equipment_id).is_dismissed is False
+        window = app.config['ALERT_MAINTENANCE_WINDOW_DAYS']
+        sas.db.session.get(sas.Equipment, equipment_id).next_maintenance_date = date.today() + timedelta(days=window + 1)
+        sas.db.session.commit()
+        assert maintenance_alert(equipment_id) is None
+        sas.reconcile_alerts()
+        assert maintenance_alert(equipment_id) is None
+
+
+def test_reconcile_removes_alerts_whose_date_left_the_window(app):
+    window = app.config['ALERT_MAINTENANCE_WINDOW_DAYS']
+    with app.app_context():
+        item = sas.Equipment(name='Groupe 2', next_maintenance_date=date.today() + timedelta(days=window + 1))
+        sas.db.session.add(item)
+        sas.db.session.commit()
+        # Written behind the ORM's back, as an import or a stale reconciler would leave it.
+        sas.db.session.execute(sas.insert(sas.Alert.__table__).values(
+            category='Maintenance', related_id=item.id, message='stale', due_date=date.today(), is_dismissed=True))
+        sas.db.session.commit()
+        assert sas.reconcile_alerts() == (0, 0, 1)
+        assert maintenance_alert(item.id) is None
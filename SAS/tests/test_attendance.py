@@ -0,0 +1,72 @@
+import threading
+
+from conftest import login, sas
+
+THREADS = 10
+ROUNDS = 5
+
+
+def test_concurrent_clock_ins_open_a_single_shift(app):
+    with app.app_context():
+        employee = sas.Employee(full_name='Anne', position='Technicien')
+        sas.db.session.add(employee)
+        sas.db.session.commit()
+        employee_id = employee.id
+
+    sessions = [login(app) for _ in range(THREADS)]
+    for _ in range(ROUNDS):
+        start = threading.Barrier(THREADS)
+        statuses, errors = [], []
+
+        def clock_in(session):
+            start.wait()
+            try:
+                statuses.append(session.post('/attendance/clock_in', data={'employee_id': employee_id}).status_code)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=clock_in, args=(session,)) for session in sessions]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert statuses == [302] * THREADS
+        with app.app_context():
+            assert len(sas.clocked_in_now()) == 1
+        assert sessions[0].post('/attendance/clock_out', data={'employee_id': employee_id}).status_code == 302
+
+    with app.app_context():
+        logs = sas.AttendanceLog.query.filter_by(employee_id=employee_id).all()
+        assert len(logs) == ROUNDS
+        assert all(log.exit_time is not None for log in logs)
+
+
+def test_concurrent_kiosk_batches_report_one_clock_in(app):
+    with app.app_context():
+        employee = sas.Employee(full_name='Bruno', position='Technicien')
+        sas.db.session.add(employee)
+        sas.db.session.commit()
+        employee_id = employee.id
+
+    sessions = [login(app) for _ in range(THREADS)]
+    start = threading.Barrier(THREADS)
+    results, errors = [], []
+
+    def send(session):
+        start.wait()
+        try:
+            response = session.post('/api/attendance/events', json={'events': [{'employee_id': employee_id, 'action': 'in'}]})
+            results.extend(result['status'] for result in response.get_json()['results'])
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=send, args=(session,)) for session in sessions]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(results) == ['already_in'] * (THREADS - 1) + ['ok']
@@ -0,0 +1,16 @@
+from conftest import sas
+
+
+def test_cli_commands_report_through_click(app, tmp_path):
+    runner = app.test_cli_runner()
+    assert runner.invoke(args=['alerts', 'reconcile']).output == "Alerts reconciled: 0 created, 0 updated, 0 deleted.\n"
+    assert runner.invoke(args=['maintenance', 'schedule']).output == "Maintenance rescheduled: 0 equipment date(s) changed.\n"
+    assert runner.invoke(args=['search', 'reindex']).output.startswith("Search index rebuilt (")
+
+    upload = tmp_path / 'clients.csv'
+    upload.write_bytes("name;email\nSociété A;a@example.fr\n;b@example.fr\n".encode('cp1252'))
+    result = runner.invoke(args=['import', 'clients', str(upload)])
+    assert result.exit_code == 0
+    assert result.output == "line 3: 'name' is required\n1 row(s) imported, 1 skipped.\n"
+    with app.app_context():
+        assert sas.Client.query.one().name == 'Société A'
@@ -0,0 +1,62 @@
+import io
+
+import pytest
+
+from conftest import sas
+
+
+def import_rows(entity, text, encoding='utf-8'):
+    return sas.import_csv(entity, io.BytesIO(text.encode(encoding)))
+
+
+def test_import_dedupes_on_the_unique_column(app):
+    with app.app_context():
+        sas.db.session.add(sas.Employee(full_name='Déjà Là', position='Technicien', email='deja@example.fr'))
+        sas.db.session.commit()
+        report = import_rows('employees', "full_name,position,email\n"
+                                          "Anne,Technicien,anne@example.fr\n"
+                                          "Anne bis,Technicien,anne@example.fr\n"
+                                          "Encore,Technicien,deja@example.fr\n")
+        assert report['inserted'] == 1
+        assert report['errors'] == [(3, "duplicate email 'anne@example.fr' in file"),
+                                    (4, "email 'deja@example.fr' already exists")]
+        assert sas.Employee.query.count() == 2
+
+
+def test_import_reports_invalid_rows_and_keeps_the_others(app):
+    with app.app_context():
+        report = import_rows('equipment', "name,serial_number,last_maintenance_date\n"
+                                          "Groupe A,SN1,2026-01-15\n"
+                                          ",SN2,\n"
+                                          "Groupe C,SN3,15/01/2026\n"
+                                          "Groupe D,SN4,\n")
+        assert (report['inserted'], report['skipped']) == (2, 2)
+        assert report['errors'] == [(3, "'name' is required"),
+                                    (4, "invalid value for 'last_maintenance_date': '15/01/2026'")]
+        assert sorted(e.serial_number for e in sas.Equipment.query) == ['SN1', 'SN4']
+
+
+def test_import_reads_semicolon_separated_windows_1252_exports(app):
+    with app.app_context():
+        report = import_rows('clients', "name;email;status\nSociété Générale;sg@example.fr;Client\n", encoding='cp1252')
+        assert report == {'inserted': 1, 'skipped': 0, 'errors': []}
+        assert sas.Client.query.one().name == 'Société Générale'
+
+
+def test_unreadable_file_imports_nothing(app, monkeypatch):
+    monkeypatch.setattr(sas, 'IMPORT_BATCH_SIZE', 2)
+    rows = ''.join(f"Client {i}\n" for i in range(5))
+    with app.app_context():
+        # 0x81 is undefined in Windows-1252 too, so no encoding applies.
+        with pytest.raises(sas.ImportFileError):
+            sas.import_csv('clients', io.BytesIO(f"name\n{rows}".encode() + b"Caf\x81\n"))
+        with pytest.raises(sas.ImportFileError, match='line 7'):
+            import_rows('clients', f"name\n{rows}\"{'x' * 200000}\"\n")
+        assert sas.Client.query.count() == 0
+
+
+def test_import_page_flashes_unreadable_files(client):
+    response = client.post('/import', data={'entity': 'clients', 'file': (io.BytesIO(b'name\nCaf\x81\n'), 'clients.csv')},
+                           follow_redirects=True)
+    assert response.status_code == 200
+    assert 'nothing was imported' in response.get_data(as_text=True)
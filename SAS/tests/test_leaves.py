@@ -0,0 +1,41 @@
+from datetime import date
+
+import pytest
+
+from conftest import sas
+
+PERIOD = {'leave_type': 'Congé payé', 'start_date': '2026-11-02', 'end_date': '2026-11-06', 'reason': ''}
+
+
+def add_employee_on_leave(name):
+    employee = sas.Employee(full_name=name, position='Technicien')
+    sas.db.session.add(employee)
+    sas.db.session.flush()
+    sas.db.session.add(sas.LeaveRequest(employee_id=employee.id, leave_type='Congé payé', status='Approved',
+                                        start_date=date(2026, 11, 4), end_date=date(2026, 11, 10)))
+    sas.db.session.commit()
+    return employee.id
+
+
+@pytest.mark.parametrize('employee_id', [None, '', 'abc', '999'])
+def test_leave_request_requires_an_existing_employee(app, client, employee_id):
+    with app.app_context():
+        add_employee_on_leave('Anne')
+    data = dict(PERIOD) if employee_id is None else dict(PERIOD, employee_id=employee_id)
+    response = client.post('/leaves/request', data=data, follow_redirects=True)
+    assert 'Please choose an employee.' in response.get_data(as_text=True)
+    with app.app_context():
+        assert sas.LeaveRequest.query.count() == 1
+
+
+def test_leave_request_only_conflicts_with_the_same_employees_leave(app, client):
+    with app.app_context():
+        anne = add_employee_on_leave('Anne')
+        bruno = sas.Employee(full_name='Bruno', position='Technicien')
+        sas.db.session.add(bruno)
+        sas.db.session.commit()
+        bruno = bruno.id
+    response = client.post('/leaves/request', data=dict(PERIOD, employee_id=bruno), follow_redirects=True)
+    assert 'Leave request submitted successfully.' in response.get_data(as_text=True)
+    response = client.post('/leaves/request', data=dict(PERIOD, employee_id=anne), follow_redirects=True)
+    assert 'overlaps an approved leave' in response.get_data(as_text=True)
@@ -0,0 +1,52 @@
+import io
+from datetime import date, timedelta
+
+from conftest import sas
+
+MONDAY = date(2026, 10, 12)
+
+
+def plan(week_start):
+    days, backlog, unplanned = sas.build_maintenance_plan(week_start, today=MONDAY)
+    return ([[job['equipment'].name for job in day['jobs']] for day in days],
+            [job['equipment'].name for job in backlog], unplanned)
+
+
+def test_later_weeks_only_get_what_earlier_weeks_could_not_take(app, monkeypatch):
+    # One 4-hour job per day, two workdays a week; four jobs due each week.
+    monkeypatch.setitem(app.config, 'MAINTENANCE_DAILY_CAPACITY_HOURS', 4)
+    monkeypatch.setitem(app.config, 'MAINTENANCE_WORKDAYS', 2)
+    monkeypatch.setitem(app.config, 'MAINTENANCE_DEFAULT_DURATION_HOURS', 4)
+    with app.app_context():
+        for i in range(8):
+            sas.db.session.add(sas.Equipment(name=f"E{i}", next_maintenance_date=MONDAY + timedelta(days=i % 4 + 7 * (i // 4))))
+        sas.db.session.commit()
+
+        assert plan(MONDAY) == ([['E0'], ['E1']], ['E2', 'E3'], 2)
+        assert plan(MONDAY + timedelta(weeks=1)) == ([['E2'], ['E3']], ['E4', 'E5', 'E6', 'E7'], 4)
+        assert plan(MONDAY + timedelta(weeks=2)) == ([['E4'], ['E5']], ['E6', 'E7'], 2)
+
+
+def test_jobs_are_not_planned_before_their_due_week(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'MAINTENANCE_DAILY_CAPACITY_HOURS', 4)
+    monkeypatch.setitem(app.config, 'MAINTENANCE_DEFAULT_DURATION_HOURS', 4)
+    with app.app_context():
+        sas.db.session.add(sas.Equipment(name='Later', next_maintenance_date=MONDAY + timedelta(days=11)))
+        sas.db.session.commit()
+        assert plan(MONDAY)[0] == [[], [], [], [], []]
+        assert plan(MONDAY + timedelta(weeks=1))[0] == [['Later'], [], [], [], []]
+
+
+def test_import_derives_missing_next_maintenance_dates(app):
+    with app.app_context():
+        sas.db.session.add(sas.MaintenanceInterval(brand='kohler', model='', interval_days=90, duration_hours=2))
+        sas.db.session.commit()
+        report = sas.import_csv('equipment', io.BytesIO(
+            b"name,brand,serial_number,last_maintenance_date,next_maintenance_date\n"
+            b"Derived,Kohler,SN1,2026-01-10,\n"
+            b"By hand,Kohler,SN2,2026-01-10,2026-02-01\n"
+            b"Never serviced,Kohler,SN3,,\n"))
+        assert report['inserted'] == 3
+        dates = {e.name: (e.next_maintenance_date, e.next_maintenance_derived) for e in sas.Equipment.query}
+        assert dates == {'Derived': (date(2026, 4, 10), True), 'By hand': (date(2026, 2, 1), False),
+                         'Never serviced': (None, False)}
@@ -0,0 +1,74 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from conftest import sas
+
+ROWS_PER_LIST = 3
+
+
+def seed_related_rows():
+    """A few rows per list, each with the related rows its page shows, so an N+1 issues extra queries."""
+    today = date.today()
+    for i in range(ROWS_PER_LIST):
+        client = sas.Client(name=f"Client {i}", email=f"client{i}@example.fr", status='Client')
+        sas.db.session.add(client)
+        sas.db.session.flush()
+        for _ in range(2):
+            sas.db.session.add(sas.Quote(quote_number=sas.allocate_quote_number(), client_id=client.id, service_type='Installation',
+                                         details='Pose', price=100, vat_rate=0.2, expires_at=datetime.utcnow() + timedelta(days=3)))
+        sas.db.session.add(sas.Equipment(name=f"Groupe {i}", brand='Kohler', model='X1', serial_number=f"SN{i}",
+                                         assigned_client=client, last_maintenance_date=today - timedelta(days=170),
+                                         next_maintenance_date=today + timedelta(days=i)))
+        employee = sas.Employee(full_name=f"Employee {i}", position='Technicien', email=f"emp{i}@example.fr")
+        sas.db.session.add(employee)
+        sas.db.session.flush()
+        sas.db.session.add(sas.LeaveRequest(employee_id=employee.id, start_date=today + timedelta(days=i), end_date=today + timedelta(days=i + 2),
+                                            status='Approved'))
+        sas.db.session.add(sas.AttendanceLog(employee_id=employee.id, work_date=today,
+                                             entry_time=datetime.utcnow() - timedelta(hours=2),
+                                             exit_time=None if i == 0 else datetime.utcnow() - timedelta(hours=1)))
+        sas.db.session.add(sas.Candidate(full_name=f"Candidate {i}", email=f"cand{i}@example.fr", position_applied_for='Technicien'))
+    sas.db.session.add(sas.MaintenanceInterval(brand='kohler', model='', interval_days=180, duration_hours=4))
+    sas.db.session.commit()
+    return sas.Client.query.first().id
+
+
+def budgeted_urls(client_id):
+    return {
+        'dashboard': '/',
+        'kpis_api': '/api/kpis',
+        'list_clients': '/clients',
+        'client_profile': f'/client/{client_id}',
+        'list_equipment': '/equipment',
+        'maintenance_plan': '/maintenance/plan',
+        'list_quotes': '/quotes',
+        'list_employees': '/employees',
+        'list_leaves': '/leaves',
+        'leave_calendar': '/leaves/calendar',
+        'attendance': '/attendance',
+        'attendance_present_api': '/api/attendance/present',
+        'timesheet': '/attendance/timesheet',
+        'search_view': '/search?q=Client',
+        'search_api': '/api/search?q=Client',
+        'list_candidates': '/candidates',
+    }
+
+
+def test_every_budgeted_route_stays_within_its_budget(app, client):
+    with app.app_context():
+        client_id = seed_related_rows()
+    urls = budgeted_urls(client_id)
+    assert set(urls) == set(sas.QUERY_BUDGETS), "add the new @query_budget routes to budgeted_urls()"
+    for endpoint, url in urls.items():
+        response = client.get(url)
+        assert response.status_code == 200, (url, response.status_code)
+        assert int(response.headers['X-Query-Count']) <= sas.QUERY_BUDGETS[endpoint], url
+
+
+def test_raise_mode_rejects_a_route_over_budget(app, client, monkeypatch):
+    with app.app_context():
+        seed_related_rows()
+    monkeypatch.setitem(sas.QUERY_BUDGETS, 'list_quotes', 0)
+    with pytest.raises(sas.QueryBudgetExceeded):
+        client.get('/quotes')
@@ -0,0 +1,42 @@
+import threading
+from datetime import datetime
+
+from conftest import login, sas
+
+THREADS = 10
+QUOTES_PER_THREAD = 5
+
+
+def test_concurrent_quote_creation_allocates_distinct_consecutive_numbers(app):
+    with app.app_context():
+        client = sas.Client(name='ACME')
+        sas.db.session.add(client)
+        sas.db.session.commit()
+        client_id = client.id
+
+    sessions = [login(app) for _ in range(THREADS)]
+    start = threading.Barrier(THREADS)
+    statuses, errors = [], []
+
+    def create_quotes(session):
+        start.wait()
+        try:
+            for _ in range(QUOTES_PER_THREAD):
+                response = session.post('/quote/add', data={'client_id': client_id, 'service_type': 'Installation',
+                                                             'details': 'Pose', 'price': '100', 'vat_rate': '0.2'})
+                statuses.append(response.status_code)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=create_quotes, args=(session,)) for session in sessions]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert statuses == [302] * (THREADS * QUOTES_PER_THREAD)
+    with app.app_context():
+        numbers = sorted(quote.quote_number for quote in sas.Quote.query)
+    year = datetime.now().year
+    assert numbers == [f"DEV-{year}-{n:04d}" for n in range(1, THREADS * QUOTES_PER_THREAD + 1)]
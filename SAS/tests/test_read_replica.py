@@ -0,0 +1,50 @@
+"""Read replica routing, with a second SQLite file standing in for the replica.
+
+The binds are read when the app module is imported, so the app runs in a subprocess with its own
+DATABASE_URL and DATABASE_REPLICA_URL.
+"""
+import os
+import subprocess
+import sys
+import textwrap
+
+SAS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = textwrap.dedent("""
+    import app as sas
+
+    with sas.app.app_context():
+        sas.db.create_all()
+        sas.db.metadata.create_all(sas.db.engines['replica'])
+        for engine, name in ((sas.db.engine, 'Primary only'), (sas.db.engines['replica'], 'Replica only')):
+            with engine.begin() as connection:
+                connection.execute(sas.insert(sas.Client.__table__).values(name=name, status='Client'))
+                connection.execute(sas.insert(sas.User.__table__).values(
+                    username='admin', password_hash=sas.bcrypt.generate_password_hash('admin').decode(), role='admin'))
+
+    sas.app.config.update(TESTING=True, RESPONSE_CACHE_BACKEND='off')
+    client = sas.app.test_client()
+    assert client.post('/login', data={'username': 'admin', 'password': 'admin'}).status_code == 302
+    with client.session_transaction() as session:
+        session.pop('_primary_until', None)
+
+    page = client.get('/clients').get_data(as_text=True)
+    assert 'Replica only' in page and 'Primary only' not in page, 'read_only views read from the replica'
+    assert client.post('/client/add', data={'name': 'Nouveau', 'email': '', 'phone': '', 'address': '',
+                                            'status': 'Prospect'}).status_code == 302
+    page = client.get('/clients').get_data(as_text=True)
+    assert 'Primary only' in page and 'Nouveau' in page, 'reads go to the primary right after a write'
+    with sas.app.app_context():
+        assert sas.Client.query.filter_by(name='Nouveau').count() == 1
+    print('ok')
+""")
+
+
+def test_read_only_views_use_the_replica_until_the_session_writes(tmp_path):
+    env = dict(os.environ,
+               DATABASE_URL=f"sqlite:///{tmp_path / 'primary.db'}",
+               DATABASE_REPLICA_URL=f"sqlite:///{tmp_path / 'replica.db'}",
+               REPLICA_STICKY_SECONDS='60')
+    result = subprocess.run([sys.executable, '-c', SCRIPT], cwd=SAS_DIR, env=env, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith('ok')
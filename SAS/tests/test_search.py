@@ -0,0 +1,14 @@
+import pytest
+
+from conftest import sas
+
+
+@pytest.mark.parametrize('limit, expected', [('-1', 1), ('0', 1), ('2', 2), ('1000000', 3), ('abc', 3)])
+def test_search_api_clamps_the_limit(app, client, monkeypatch, limit, expected):
+    monkeypatch.setitem(app.config, 'SEARCH_RESULTS_LIMIT', 3)
+    with app.app_context():
+        sas.db.session.add_all(sas.Client(name=f"Dupont {i}") for i in range(5))
+        sas.db.session.commit()
+    response = client.get('/api/search', query_string={'q': 'Dupont', 'limit': limit})
+    assert response.status_code == 200
+    assert len(response.get_json()) == expected